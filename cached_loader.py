@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Memoized load_all_datasets() for the test scripts
+
+The parsed datasets are pickled under .cache/, keyed by the modification
+times of the MLS exports and of data_preprocessing.py, so editing either one
+triggers a fresh load. Within a process the result is also kept in memory.
+A load where any dataset failed is never written to disk, so a transient
+error is retried on the next run instead of being frozen into the snapshot.
+"""
+
+import functools
+import glob
+import hashlib
+import os
+import pickle
+
+from data_preprocessing import load_all_datasets
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(current_dir, ".cache")
+
+# Files whose changes invalidate the cached datasets
+SOURCE_FILES = [
+    os.path.join(current_dir, "RebeccaRidge11001900sqft.txt"),
+    os.path.join(current_dir, "SunriseRebeccaRidge11001900sqft.txt"),
+    os.path.join(current_dir, "data_preprocessing.py"),
+]
+
+def cache_path():
+    """Get the snapshot path for the current versions of the source files"""
+    stamps = tuple((os.path.basename(p), os.path.getmtime(p) if os.path.exists(p) else None)
+                   for p in SOURCE_FILES)
+    key = hashlib.md5(repr(stamps).encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"datasets_{key}.pkl")
+
+@functools.lru_cache(maxsize=1)
+def cached_load():
+    """Load all datasets, reusing the on-disk snapshot when it is current"""
+    path = cache_path()
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                datasets = pickle.load(f)
+            if all(data is not None for data in datasets.values()):
+                return datasets
+            print(f"Ignoring incomplete dataset cache {path}")
+        except Exception as e:
+            print(f"Ignoring unreadable dataset cache {path}: {e}")
+
+    datasets = load_all_datasets()
+
+    # Only snapshot complete loads - a failed dataset is stored as None
+    if any(data is None for data in datasets.values()):
+        return datasets
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Snapshots for older versions of the source files can never be hit again
+    for stale in glob.glob(os.path.join(CACHE_DIR, "datasets_*.pkl")):
+        if stale != path:
+            os.remove(stale)
+    with open(path, 'wb') as f:
+        pickle.dump(datasets, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return datasets
@@ -0,0 +1,31 @@
+"""
+Shared pytest fixtures - the datasets are loaded, and the 1600 sq ft pricing
+analysis run, once per test session
+"""
+
+import pytest
+
+from cached_loader import cached_load
+from data_preprocessing import summarize_datasets
+
+@pytest.fixture(scope='session')
+def datasets():
+    """All loaded datasets, shared by every test"""
+    return cached_load()
+
+@pytest.fixture(scope='session')
+def dataset_summary(datasets):
+    """Per-dataset record counts, built once from the loaded datasets"""
+    return summarize_datasets(datasets)
+
+@pytest.fixture(scope='session')
+def pricing_1600(datasets):
+    """Premium pricing analysis for a 1600 sq ft home, or None without both datasets"""
+    from neighborhood_analysis_app import analyze_premium_home_pricing
+    
+    sunrise_data = datasets.get('Sunrise Area')
+    rebecca_data = datasets.get('Rebecca Ridge')
+    if not sunrise_data or not rebecca_data:
+        return None
+    
+    return analyze_premium_home_pricing(sunrise_data['sold'], rebecca_data['sold'], 1600)
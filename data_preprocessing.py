@@ -3,6 +3,12 @@ import numpy as np
 from datetime import datetime
 import re
 
+# Date format used by the MLS tab-delimited exports
+MLS_DATE_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+
+# Known problem listings, as normalized addresses (see normalize_address_series)
+BAD_ADDRESSES = {'15807 131st'}
+
 def clean_price_column(price_str):
     """Clean price columns by removing $ and commas, converting to float"""
     if pd.isna(price_str) or price_str == '':
@@ -14,6 +20,32 @@ def clean_price_column(price_str):
     except (ValueError, TypeError):
         return np.nan
 
+def clean_price_series(prices):
+    """Vectorized clean_price_column for a whole price column"""
+    if pd.api.types.is_numeric_dtype(prices):
+        return prices.astype(float)
+    stripped = prices.astype(str).str.replace(r'[\$,]', '', regex=True)
+    return pd.to_numeric(stripped, errors='coerce').astype(float)
+
+def downcast_numeric_columns(df, columns):
+    """Downcast numeric columns in place to the narrowest int/float dtype that holds them"""
+    for col in columns:
+        if col in df.columns:
+            downcast = 'integer' if pd.api.types.is_integer_dtype(df[col]) else 'float'
+            df[col] = pd.to_numeric(df[col], downcast=downcast)
+    return df
+
+def to_numpy_numeric(values):
+    """Coerce a column to numbers on a numpy dtype, with missing values as NaN"""
+    values = pd.to_numeric(values, errors='coerce')
+    if isinstance(values.dtype, pd.ArrowDtype):
+        values = values.astype(np.float64 if values.isna().any() else values.dtype.numpy_dtype)
+    return values
+
+def normalize_address_series(addresses):
+    """Lower-case addresses and collapse whitespace so equal addresses compare equal"""
+    return addresses.str.lower().str.replace(r'\s+', ' ', regex=True).str.strip()
+
 def clean_date_column(date_str):
     """Clean date columns and convert to datetime"""
     if pd.isna(date_str) or date_str == '':
@@ -24,15 +56,19 @@ def clean_date_column(date_str):
     except:
         return pd.NaT
 
+def clean_date_series(dates):
+    """Vectorized clean_date_column for a whole date column"""
+    # Parse the standard MLS export format in one pass; only entries in any
+    # other format fall back to per-value parsing
+    parsed = pd.to_datetime(dates, format=MLS_DATE_FORMAT, errors='coerce')
+    unparsed = parsed.isna() & dates.notna()
+    if unparsed.any():
+        parsed[unparsed] = dates[unparsed].apply(clean_date_column)
+    return parsed
+
 def load_and_preprocess_data(file_path, dataset_name="Unknown"):
     """Load and preprocess the MLS data"""
     
-    # Read the tab-delimited file
-    df = pd.read_csv(file_path, sep='\t', low_memory=False)
-    
-    # Add dataset identifier
-    df['Dataset'] = dataset_name
-    
     # Define the most pertinent columns for analysis
     key_columns = [
         'Listing Number', 'Street Number', 'Street Name', 'City', 'State', 'Zip Code',
@@ -45,29 +81,40 @@ def load_and_preprocess_data(file_path, dataset_name="Unknown"):
         'Style Code', 'Fireplaces Total', 'Parking Covered Total'
     ]
     
+    # Read the tab-delimited file, parsing only the key columns (the export has ~140)
+    # into Arrow-backed columns with the multi-threaded pyarrow parser. That engine
+    # needs usecols as a list of names that exist, so read the header line first.
+    with open(file_path, encoding='utf-8') as f:
+        header = f.readline().rstrip('\r\n').split('\t')
+    df = pd.read_csv(file_path, sep='\t', usecols=[col for col in key_columns if col in header],
+                     engine='pyarrow', dtype_backend='pyarrow')
+    
+    # Add dataset identifier
+    df['Dataset'] = dataset_name
+    
     # Keep only the key columns that exist in the dataset
     available_columns = [col for col in key_columns if col in df.columns]
     df_clean = df[available_columns].copy()
     
-    # Clean price columns
+    # Clean price columns (column-wise, same result as clean_price_column per cell)
     price_columns = ['Listing Price', 'Selling Price', 'Current Price', 'Original Price', 'Taxes Annual']
     for col in price_columns:
         if col in df_clean.columns:
-            df_clean[col] = df_clean[col].apply(clean_price_column)
+            df_clean[col] = clean_price_series(df_clean[col])
     
-    # Clean date columns
+    # Clean date columns (column-wise, same result as clean_date_column per cell)
     date_columns = ['Listing Date', 'Selling Date', 'Entry Date', 'Pending Date']
     for col in date_columns:
         if col in df_clean.columns:
-            df_clean[col] = df_clean[col].apply(clean_date_column)
+            df_clean[col] = clean_date_series(df_clean[col])
     
-    # Clean numeric columns
+    # Clean numeric columns - numpy dtypes, so empty medians stay NaN rather than NA
     numeric_columns = ['Bedrooms', 'Bathrooms', 'Finished Sqft', 'Square Footage', 
                       'Lot SqFt', 'Year Built', 'DOM', 'CDOM', 'Fireplaces Total', 
                       'Parking Covered Total']
     for col in numeric_columns:
         if col in df_clean.columns:
-            df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
+            df_clean[col] = to_numpy_numeric(df_clean[col])
     
     # Create additional useful columns
     
@@ -92,17 +139,31 @@ def load_and_preprocess_data(file_path, dataset_name="Unknown"):
         df_clean['Price_Difference'] = df_clean['Selling Price'] - df_clean['Listing Price']
         df_clean['Price_Change_Percent'] = (df_clean['Price_Difference'] / df_clean['Listing Price']) * 100
     
-    # Full address for display
+    # Downcast every numeric measure once the derived columns are computed;
+    # none need 64-bit precision and every later filter reads fewer bytes
+    downcast_numeric_columns(df_clean, price_columns + numeric_columns +
+                             ['Price_Per_SqFt', 'Sale_Year', 'Sale_Month', 'Sale_Quarter',
+                              'Price_Difference', 'Price_Change_Percent'])
+    
+    # Full address for display (Arrow string so substring lookups run in Arrow kernels)
     if 'Street Number' in df_clean.columns and 'Street Name' in df_clean.columns:
         df_clean['Full_Address'] = (df_clean['Street Number'].astype(str) + ' ' + 
                                    df_clean['Street Name'].astype(str)).str.replace('nan', '').str.strip()
     elif 'Street Name' in df_clean.columns:
         df_clean['Full_Address'] = df_clean['Street Name'].astype(str)
+    if 'Full_Address' in df_clean.columns:
+        df_clean['Full_Address'] = df_clean['Full_Address'].astype('string[pyarrow]')
+        df_clean['Full_Address_norm'] = normalize_address_series(df_clean['Full_Address'])
     
     # Clean up status column
     if 'Status' in df_clean.columns:
         df_clean['Status'] = df_clean['Status'].str.strip()
     
+    # Store low-cardinality text columns used in filters as categoricals
+    for col in ['Property Sub Type', 'Status', 'Style Code', 'City', 'Street Name']:
+        if col in df_clean.columns:
+            df_clean[col] = df_clean[col].astype('category')
+    
     # Filter for sold, pending, and active properties for comprehensive market analysis
     if 'Status' in df_clean.columns:
         df_sold = df_clean[df_clean['Status'].isin(['Sold', 'Active', 'Pending', 'Pending Inspection', 'Pending Short Sale'])].copy()
@@ -111,9 +172,18 @@ def load_and_preprocess_data(file_path, dataset_name="Unknown"):
     
     # Create unified price column for analysis (use appropriate price based on status)
     if 'Status' in df_sold.columns:
-        df_sold['Analysis_Price'] = df_sold.apply(lambda row: 
-            row['Selling Price'] if row['Status'] == 'Sold' and pd.notna(row.get('Selling Price')) 
-            else row.get('Current Price', row.get('Listing Price', np.nan)), axis=1)
+        # Sold homes use their selling price, everything else its current (or listing) price
+        if 'Current Price' in df_sold.columns:
+            fallback_price = df_sold['Current Price']
+        elif 'Listing Price' in df_sold.columns:
+            fallback_price = df_sold['Listing Price']
+        else:
+            fallback_price = pd.Series(np.nan, index=df_sold.index)
+        if 'Selling Price' in df_sold.columns:
+            use_selling = (df_sold['Status'] == 'Sold') & df_sold['Selling Price'].notna()
+            df_sold['Analysis_Price'] = df_sold['Selling Price'].where(use_selling, fallback_price)
+        else:
+            df_sold['Analysis_Price'] = fallback_price
     else:
         df_sold['Analysis_Price'] = df_sold.get('Selling Price', np.nan)
     
@@ -176,17 +246,20 @@ def load_and_preprocess_data(file_path, dataset_name="Unknown"):
     # Specifically eliminate 15807 131st (problematic outlier - 2688 sq ft shouldn't be in 1100-1900 dataset)
     if 'Street Number' in df_sold.columns and 'Street Name' in df_sold.columns:
         pre_elimination = len(df_sold)
-        df_sold = df_sold[~((df_sold['Street Number'] == 15807) & 
-                           (df_sold['Street Name'].str.contains('131st', case=False, na=False)))]
+        # Match the few distinct street names, then select rows by category code
+        street_names = df_sold['Street Name']
+        is_131st = street_names.cat.categories.str.contains('131st', case=False, na=False)
+        on_131st = street_names.cat.codes.isin(np.flatnonzero(is_131st))
+        df_sold = df_sold[~((df_sold['Street Number'] == 15807) & on_131st)]
         post_elimination = len(df_sold)
         
         if pre_elimination > post_elimination:
             print(f"🚫 Specifically eliminated 15807 131st property ({pre_elimination - post_elimination} properties removed)")
     
-    # Additional check: Remove any property with Full_Address containing "15807 131st" (backup filter)
-    if 'Full_Address' in df_sold.columns:
+    # Additional check: Remove any property whose normalized address is a known problem (backup filter)
+    if 'Full_Address_norm' in df_sold.columns:
         pre_backup = len(df_sold)
-        df_sold = df_sold[~df_sold['Full_Address'].str.contains('15807 131st', case=False, na=False)]
+        df_sold = df_sold[~df_sold['Full_Address_norm'].isin(BAD_ADDRESSES)]
         post_backup = len(df_sold)
         
         if pre_backup > post_backup:
@@ -253,24 +326,50 @@ def load_all_datasets():
     
     return datasets
 
+def summarize_datasets(datasets):
+    """Per-dataset record counts as a small DataFrame (zero counts for failed loads)"""
+    names = list(datasets)
+    loaded = [datasets[name] is not None for name in names]
+    summary = pd.DataFrame({
+        'name': names,
+        'loaded': loaded,
+        'total_records': [datasets[name]['total_records'] if ok else 0 for name, ok in zip(names, loaded)],
+        'sold_records': [datasets[name]['sold_records'] if ok else 0 for name, ok in zip(names, loaded)],
+    })
+    return summary.astype({'name': 'category'})
+
 # Function to get recent market data (last 12 months)
 def get_recent_market_data(df_sold, months_back=12):
     """Get data from the last N months for current market analysis"""
+    return get_recent_market_windows(df_sold, (months_back,))[months_back]
+
+def get_recent_market_windows(df_sold, months_list=(3, 6, 12, 24)):
+    """Get several "last N months" slices of the same data from one date scan"""
     if 'Selling Date' not in df_sold.columns:
-        return df_sold
+        return {months: df_sold for months in months_list}
     
-    # Get the most recent date in the dataset
     max_date = df_sold['Selling Date'].max()
     if pd.isna(max_date):
-        return df_sold
-    
-    # Calculate the cutoff date
-    cutoff_date = max_date - pd.DateOffset(months=months_back)
+        return {months: df_sold for months in months_list}
     
-    # Filter for recent sales
-    recent_sales = df_sold[df_sold['Selling Date'] >= cutoff_date]
+    dates = df_sold['Selling Date'].to_numpy()
+    windows = {}
+    for months in months_list:
+        cutoff_date = np.datetime64(max_date - pd.DateOffset(months=months))
+        windows[months] = df_sold[dates >= cutoff_date]
     
-    return recent_sales
+    return windows
+
+def column_medians(df_sold, columns):
+    """Medians of just the given columns from their raw float arrays, skipping missing values"""
+    medians = {}
+    for col in columns:
+        if col not in df_sold.columns:
+            continue
+        values = df_sold[col].to_numpy(dtype='float64', na_value=np.nan)
+        values = values[~np.isnan(values)]
+        medians[col] = np.median(values) if len(values) > 0 else np.nan
+    return medians
 
 # Function to calculate market statistics
 def calculate_market_stats(df_sold):
@@ -4,10 +4,8 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import seaborn as sns
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
-from data_preprocessing import load_all_datasets, get_recent_market_data, calculate_market_stats
+from data_preprocessing import load_all_datasets, get_recent_market_data, get_recent_market_windows, calculate_market_stats, column_medians
 
 # Configure Streamlit page
 st.set_page_config(
@@ -39,12 +37,131 @@ st.markdown("""
         border-left: 4px solid #1f77b4;
         margin: 1rem 0;
     }
+    .card-alert {
+        background-color: #fff3cd;
+        padding: 1.5rem;
+        border-radius: 0.8rem;
+        margin: 2rem 0;
+        border: 1px solid #ffeaa7;
+    }
+    .card-alert h4 { margin: 0 0 0.5rem 0; color: #856404; }
+    .card-alert p { margin: 0; color: #856404; font-weight: 500; }
+    .card-banner {
+        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+        padding: 2rem;
+        border-radius: 1rem;
+        margin-bottom: 2rem;
+        border-left: 4px solid #007bff;
+    }
+    .card-banner h1 { margin: 0; color: #495057; font-size: 2.2em; }
+    .card-banner h3 { margin: 0.5rem 0 0 0; color: #6c757d; }
+    .card-banner p { margin: 0.5rem 0 0 0; color: #6c757d; font-style: italic; }
+    .card-banner p.byline { margin: 1rem 0 0 0; font-size: 0.9em; font-style: normal; }
+    .card-price {
+        background: linear-gradient(135deg, #007bff 0%, #0056b3 100%);
+        color: white;
+        padding: 3rem;
+        border-radius: 1rem;
+        text-align: center;
+        margin: 2rem 0;
+    }
+    .card-price h2 { margin: 0; color: white; font-weight: 300; opacity: 0.9; }
+    .card-price h1 { margin: 1rem 0; color: white; font-size: 3.5em; font-weight: bold; }
+    .card-price p { margin: 0; color: white; opacity: 0.9; font-size: 1.2em; }
+    .card-metric {
+        background-color: #f8f9fa;
+        padding: 1.5rem;
+        border-radius: 0.8rem;
+        text-align: center;
+        border: 1px solid #dee2e6;
+    }
+    .card-metric h4 { margin: 0; color: #495057; }
+    .card-metric h2 { margin: 0.5rem 0; }
+    .card-metric p { margin: 0; color: #6c757d; font-size: 0.9em; }
+    .card-metric p.note { margin: 0.5rem 0 0 0; font-size: 0.8em; font-style: italic; }
+    .card-feature {
+        background-color: #f8f9fa;
+        padding: 1.2rem;
+        border-radius: 0.6rem;
+        border-left: 4px solid #007bff;
+        margin-bottom: 1rem;
+        color: #495057;
+    }
+    .card-feature h5 { margin: 0 0 0.8rem 0; color: #495057; }
+    .card-note {
+        background-color: #e8f4f8;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin-top: 1rem;
+    }
+    .card-context {
+        background-color: #f8f9fa;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #6c757d;
+        margin-bottom: 1rem;
+    }
+    .card-context .value { color: #495057; font-size: 1.1em; }
+    .card-context small, .card-comp small { color: #6c757d; }
+    .card-comp {
+        background-color: #f8f9fa;
+        padding: 0.8rem;
+        border-radius: 0.4rem;
+        margin: 0.5rem 0;
+        border-left: 3px solid #007bff;
+    }
+    .card-final {
+        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+        padding: 2rem;
+        border-radius: 1rem;
+        border-left: 4px solid #007bff;
+        margin: 2rem 0;
+    }
+    .card-final h4 { margin: 0 0 1rem 0; color: #495057; }
+    .card-final p { margin: 0; color: #495057; font-size: 1.1em; line-height: 1.6; }
+    .card-proceeds {
+        background: linear-gradient(135deg, #28a745, #20c997);
+        color: white;
+        padding: 2rem;
+        border-radius: 1rem;
+        text-align: center;
+    }
+    .card-proceeds h3 { margin: 0; color: white; }
+    .card-proceeds h1 { margin: 1rem 0; color: white; font-size: 2.2em; }
+    .card-proceeds p { margin: 0; color: white; opacity: 0.9; }
+    .card-tally {
+        background-color: #f8f9fa;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin: 1rem 0;
+        text-align: center;
+    }
+    .tile-row { display: flex; gap: 1rem; }
+    .card-tile {
+        flex: 1;
+        color: white;
+        padding: 1.5rem;
+        border-radius: 1rem;
+        text-align: center;
+        margin: 0.5rem 0;
+    }
+    .card-tile h3 { margin: 0; color: white; font-size: 1.4em; }
+    .card-tile hr { border-color: rgba(255,255,255,0.3); margin: 1rem 0; }
+    .card-tile p { margin: 0.5rem 0; color: white; font-weight: bold; }
+    .card-tile p.details { margin: 0; color: rgba(255,255,255,0.9); font-size: 0.9em; font-weight: normal; }
+    .tile-purple { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
+    .tile-green { background: linear-gradient(135deg, #28a745 0%, #20c997 100%); }
+    .tile-orange { background: linear-gradient(135deg, #ff7f0e 0%, #ff6b6b 100%); }
+    .text-blue { color: #007bff; }
+    .text-green { color: #28a745; }
+    .accent-blue { border-left-color: #007bff; }
+    .accent-green { border-left-color: #28a745; }
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+@st.cache_resource
 def load_data():
-    """Load and cache all datasets"""
+    """Load and cache all datasets (shared across reruns - treat the frames as read-only)"""
     import os
     
     # Minimal path verification (helps with initialization)
@@ -58,23 +175,118 @@ def load_data():
     else:
         st.error("❌ Data files not found")
     
-    return load_all_datasets()
+    datasets = load_all_datasets()
+    
+    # Sidebar widget bounds come from the unfiltered data, so compute them once here
+    for data in datasets.values():
+        if data is not None:
+            data['filter_bounds'] = compute_filter_bounds(data['sold'])
+    
+    return datasets
+
+def compute_filter_bounds(df_sold):
+    """Get the sidebar filter bounds (date range, property types, price range) for a dataset"""
+    bounds = {}
+    if len(df_sold) == 0:
+        return bounds
+    
+    if 'Selling Date' in df_sold.columns:
+        bounds['date_min'] = df_sold['Selling Date'].min().date()
+        bounds['date_max'] = df_sold['Selling Date'].max().date()
+    
+    if 'Property Sub Type' in df_sold.columns:
+        bounds['types'] = tuple(df_sold['Property Sub Type'].dropna().unique())
+    
+    if 'Selling Price' in df_sold.columns:
+        bounds['price_min'] = int(df_sold['Selling Price'].min())
+        bounds['price_max'] = int(df_sold['Selling Price'].max())
+    
+    return bounds
+
+def frame_fingerprint(df):
+    """Cheap cache key for a DataFrame: row count, latest sale date and row labels"""
+    # Filtered frames are row subsets of the loaded data, so hashing the index
+    # identifies them without hashing every cell
+    return (len(df),
+            df['Selling Date'].max() if 'Selling Date' in df else None,
+            int(pd.util.hash_pandas_object(df.index, index=False).sum()))
+
+FRAME_HASH_FUNCS = {pd.DataFrame: frame_fingerprint}
+
+# Scatter plots with more points than this are drawn with WebGL
+SCATTERGL_MIN_POINTS = 2000
+
+# Market velocity cards, indexed by DOM bucket: <= 30 days, <= 60 days, slower
+VELOCITY_TEMPLATES = (
+    """
+<div style="background: linear-gradient(135deg, #e8f5e8 0%, #4caf50 100%); padding: 1.5rem; border-radius: 0.5rem; margin: 1rem 0; border-left: 4px solid #4caf50;">
+    <h4 style="margin: 0; color: #2e7d32;">🔥 Fast Market</h4>
+    <p style="margin: 0.5rem 0; font-size: 1.1em;">Homes sell in <strong>{dom:.0f} days</strong></p>
+    <p style="margin: 0; color: #2e7d32;"><em>Sellers' market conditions</em></p>
+</div>
+""",
+    """
+<div style="background: linear-gradient(135deg, #fff3e0 0%, #ffcc02 100%); padding: 1.5rem; border-radius: 0.5rem; margin: 1rem 0; border-left: 4px solid #ff9800;">
+    <h4 style="margin: 0; color: #e65100;">📊 Balanced Market</h4>
+    <p style="margin: 0.5rem 0; font-size: 1.1em;">Homes sell in <strong>{dom:.0f} days</strong></p>
+    <p style="margin: 0; color: #e65100;"><em>Normal market conditions</em></p>
+</div>
+""",
+    """
+<div style="background: linear-gradient(135deg, #fce4ec 0%, #f8bbd9 100%); padding: 1.5rem; border-radius: 0.5rem; margin: 1rem 0; border-left: 4px solid #e91e63;">
+    <h4 style="margin: 0; color: #ad1457;">🐌 Slower Market</h4>
+    <p style="margin: 0.5rem 0; font-size: 1.1em;">Homes sell in <strong>{dom:.0f} days</strong></p>
+    <p style="margin: 0; color: #ad1457;"><em>Buyers' market conditions</em></p>
+</div>
+""",
+)
+
+# Starting values for the Net Proceeds calculator inputs; the sale price
+# defaults to the recommended price, so it is seeded when the section renders
+NET_PROCEEDS_DEFAULTS = {
+    "net_listing_agent_rate": 2.5,
+    "net_selling_agent_rate": 2.5,
+    "net_title_insurance": 1300,
+    "net_escrow_fees": 1400,
+    "net_mortgage_payoff": 285000,
+    "net_transfer_tax": 500,
+    "net_excise_tax": 9000,
+    "net_misc_fees": 300,
+    "net_concessions": 0,
+}
 
-def create_price_trend_chart(df_sold):
-    """Create an interactive price trend chart over time"""
+# Net Proceeds calculator inputs that keep their values across sections
+NET_PROCEEDS_WIDGET_KEYS = ("net_sale_price", *NET_PROCEEDS_DEFAULTS)
+
+@st.cache_data(ttl=3600, hash_funcs=FRAME_HASH_FUNCS, show_spinner=False)
+def compute_monthly_aggregates(df_sold):
+    """Compute all per-month market statistics in a single groupby pass"""
     if 'Sale_Year_Month' not in df_sold.columns or 'Selling Price' not in df_sold.columns:
         return None
     
-    # Monthly price trends
-    monthly_stats = df_sold.groupby('Sale_Year_Month').agg({
-        'Selling Price': ['median', 'mean', 'count'],
-        'Price_Per_SqFt': ['median', 'mean']
-    }).round(2)
+    aggregations = {
+        'Median_Price': ('Selling Price', 'median'),
+        'Mean_Price': ('Selling Price', 'mean'),
+        'Sales_Count': ('Selling Price', 'count')
+    }
+    if 'Price_Per_SqFt' in df_sold.columns:
+        aggregations['Median_PriceSqFt'] = ('Price_Per_SqFt', 'median')
+        aggregations['Mean_PriceSqFt'] = ('Price_Per_SqFt', 'mean')
+    if 'DOM' in df_sold.columns:
+        aggregations['Median_DOM'] = ('DOM', 'median')
     
-    monthly_stats.columns = ['Median_Price', 'Mean_Price', 'Sales_Count', 'Median_PriceSqFt', 'Mean_PriceSqFt']
+    monthly_stats = df_sold.groupby('Sale_Year_Month').agg(**aggregations).round(2)
     monthly_stats = monthly_stats.reset_index()
     monthly_stats['Date'] = monthly_stats['Sale_Year_Month'].astype(str)
     
+    return monthly_stats
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def create_price_trend_chart(monthly_stats):
+    """Create an interactive price trend chart over time from precomputed monthly aggregates"""
+    if monthly_stats is None or 'Median_PriceSqFt' not in monthly_stats.columns:
+        return None
+    
     # Create single chart with secondary y-axis for price per sqft
     fig = make_subplots(
         specs=[[{"secondary_y": True}]]
@@ -114,6 +326,7 @@ def create_price_trend_chart(df_sold):
     
     return fig
 
+@st.cache_data(ttl=3600, hash_funcs=FRAME_HASH_FUNCS, show_spinner=False)
 def create_simplified_price_chart(df_sold):
     """Create a simplified, clean price vs square footage chart"""
     if len(df_sold) == 0 or 'Finished Sqft' not in df_sold.columns or 'Selling Price' not in df_sold.columns:
@@ -122,11 +335,17 @@ def create_simplified_price_chart(df_sold):
     # Clean data
     clean_data = df_sold.dropna(subset=['Finished Sqft', 'Selling Price']).copy()
     
+    # Build hover text column-wise instead of per row
+    address = clean_data['Full_Address'].fillna('N/A').astype(str) if 'Full_Address' in clean_data.columns else 'N/A'
+    hover_text = (address + '<br>$' + clean_data['Selling Price'].map('{:,.0f}'.format) +
+                  '<br>' + clean_data['Finished Sqft'].map('{:.0f}'.format) + ' sq ft')
+    
     # Create simple scatter plot
     fig = go.Figure()
     
-    # Add scatter points
-    fig.add_trace(go.Scatter(
+    # Add scatter points - Scattergl renders large point counts on the GPU
+    scatter_trace = go.Scattergl if len(clean_data) > SCATTERGL_MIN_POINTS else go.Scatter
+    fig.add_trace(scatter_trace(
         x=clean_data['Finished Sqft'],
         y=clean_data['Selling Price'],
         mode='markers',
@@ -135,8 +354,7 @@ def create_simplified_price_chart(df_sold):
             color='#1f77b4',
             opacity=0.7
         ),
-        text=[f"{row.get('Full_Address', 'N/A')}<br>${row['Selling Price']:,.0f}<br>{row['Finished Sqft']:.0f} sq ft" 
-              for _, row in clean_data.iterrows()],
+        text=hover_text.to_numpy(),
         hovertemplate='%{text}<extra></extra>',
         name='Sold Homes'
     ))
@@ -161,17 +379,77 @@ def get_top_sales(df_sold, top_n=5):
     if 'Selling Price' not in df_sold.columns or len(df_sold) == 0:
         return pd.DataFrame()
     
-    top_sales = df_sold.nlargest(top_n, 'Selling Price').copy()
+    # Partial selection of the top N, then sort just those (ties keep row order)
+    prices = df_sold['Selling Price'].to_numpy(dtype=float)
+    candidates = np.flatnonzero(~np.isnan(prices))
+    if len(candidates) > top_n:
+        candidates = np.sort(candidates[np.argpartition(-prices[candidates], top_n - 1)[:top_n]])
+    top_idx = candidates[np.argsort(-prices[candidates], kind='stable')]
     
     # Select relevant columns for display
     display_cols = []
     for col in ['Full_Address', 'Selling Price', 'Selling Date', 'Finished Sqft', 
                 'Bedrooms', 'Bathrooms', 'DOM', 'Year Built']:
-        if col in top_sales.columns:
+        if col in df_sold.columns:
             display_cols.append(col)
     
-    return top_sales[display_cols]
+    return df_sold.iloc[top_idx][display_cols]
+
+def top_sales_tiles_html(top_sales, tile_class, max_tiles=5):
+    """Build the HTML for a horizontal row of top sale tiles as one string"""
+    columns = list(top_sales.columns)
+    tiles = []
+    for values in top_sales.head(max_tiles).itertuples(index=False, name=None):
+        row = dict(zip(columns, values))
+        # Use appropriate price field based on status
+        price = row.get('Analysis_Price', row.get('Selling Price', 0))
+        sale_date = row.get('Selling Date', 'N/A').strftime('%b %Y') if pd.notna(row.get('Selling Date')) else 'Recent'
+        tiles.append(f"""<div class="card-tile {tile_class}">
+<h3>${price:,.0f}</h3>
+<hr>
+<p>{row.get('Full_Address', 'N/A')}</p>
+<p class="details">
+{row.get('Finished Sqft', 'N/A'):.0f} sq ft<br>
+{row.get('Bedrooms', 'N/A'):.0f}bed/{row.get('Bathrooms', 'N/A'):.1f}bath<br>
+{row.get('Status', 'N/A')}<br>
+{sale_date}
+</p>
+</div>""")
+    return '<div class="tile-row">' + "".join(tiles) + '</div>'
+
+def build_comparable_records(top_sales):
+    """Convert comparable sales to plain records with pre-formatted display strings"""
+    if len(top_sales) == 0:
+        return []
+    
+    comp_cols = ['Selling Price', 'Finished Sqft', 'Selling Date', 'Listing Number', 'Full_Address']
+    comps = top_sales[[col for col in comp_cols if col in top_sales.columns]].copy()
+    
+    # Format each column in one pass rather than once per card
+    price = comps['Selling Price']
+    sqft = comps['Finished Sqft'] if 'Finished Sqft' in comps.columns else pd.Series(0, index=comps.index)
+    psf = (price / sqft).where(sqft > 0, 0)
+    comps['Price_Label'] = '$' + price.map('{:,.0f}'.format)
+    comps['Size_Label'] = sqft.map('{:.0f}'.format) + ' sq ft • $' + psf.map('{:.0f}'.format) + '/sq ft'
+    if 'Selling Date' in comps.columns:
+        comps['Date_Label'] = comps['Selling Date'].dt.strftime('%b %Y').fillna('Unknown')
+    else:
+        comps['Date_Label'] = 'Unknown'
+    
+    return comps.to_dict('records')
+
+def comparable_cards_html(comps, accent_class):
+    """Build the HTML for a column of comparable sale cards as one string"""
+    cards = []
+    for row in comps:
+        cards.append(f"""<div class="card-comp {accent_class}">
+<strong>{row['Price_Label']}</strong> • {row['Size_Label']}<br>
+<strong>{row.get('Full_Address', 'N/A')}</strong><br>
+<small>MLS #{row.get('Listing Number', 'N/A')} • {row['Date_Label']}</small>
+</div>""")
+    return "\n".join(cards)
 
+@st.cache_data(hash_funcs=FRAME_HASH_FUNCS, show_spinner=False)
 def analyze_premium_home_pricing(sunrise_data, rebecca_data, home_sqft=1600):
     """Analyze pricing for a premium remodeled home using broader market data"""
     
@@ -182,17 +460,22 @@ def analyze_premium_home_pricing(sunrise_data, rebecca_data, home_sqft=1600):
     if len(sunrise_recent) == 0:
         return None
     
-    # Calculate market stats from broader Sunrise area
-    sunrise_stats = calculate_market_stats(sunrise_recent)
-    rebecca_stats = calculate_market_stats(rebecca_recent) if len(rebecca_recent) > 0 else {}
+    # Only a few medians feed the pricing, so take them straight from the
+    # column arrays instead of running the full calculate_market_stats
+    sunrise_stats = column_medians(sunrise_recent, ['Selling Price', 'Price_Per_SqFt', 'DOM'])
+    rebecca_stats = column_medians(rebecca_recent, ['Selling Price']) if len(rebecca_recent) > 0 else {}
     
     # Get comparables from both areas
     sunrise_top = sunrise_recent.nlargest(5, 'Selling Price')
     rebecca_top = rebecca_recent.nlargest(3, 'Selling Price') if len(rebecca_recent) > 0 else pd.DataFrame()
     
+    # Comparable cards only need a handful of fields, so hand them over as plain records
+    sunrise_comps = build_comparable_records(sunrise_top.head(3))
+    rebecca_comps = build_comparable_records(rebecca_top)
+    
     # Pricing strategy based on broader market
-    sunrise_median = sunrise_stats.get('median_price', 0)
-    sunrise_psf = sunrise_stats.get('median_price_per_sqft', 0)
+    sunrise_median = sunrise_stats.get('Selling Price', 0)
+    sunrise_psf = sunrise_stats.get('Price_Per_SqFt', 0)
     
     # Premium for extensive remodel (conservative approach)
     remodel_premium = 50000  # $50k premium for luxury remodel
@@ -209,52 +492,53 @@ def analyze_premium_home_pricing(sunrise_data, rebecca_data, home_sqft=1600):
     return {
         'sunrise_median': sunrise_median,
         'sunrise_psf': sunrise_psf,
-        'rebecca_median': rebecca_stats.get('median_price', 0),
+        'rebecca_median': rebecca_stats.get('Selling Price', 0),
         'recommended_price': recommended_price,
-        'sunrise_dom': sunrise_stats.get('median_dom', 0),
-        'sunrise_top': sunrise_top.head(3),
-        'rebecca_top': rebecca_top,
+        'sunrise_dom': sunrise_stats.get('DOM', 0),
+        'sunrise_top': sunrise_comps,
+        'rebecca_top': rebecca_comps,
         'premium_psf': sunrise_psf * 1.10,
         'recent_sales_count': len(sunrise_recent)
     }
 
+@st.cache_data(ttl=3600, hash_funcs=FRAME_HASH_FUNCS, show_spinner=False)
 def analyze_2025_market_trend(df_sold):
     """Analyze what's happening in 2025 specifically - simplified and clear"""
     if 'Sale_Year' not in df_sold.columns or len(df_sold) == 0:
         return None, None, None
     
-    # Get 2025 data
-    df_2025 = df_sold[df_sold['Sale_Year'] == 2025].copy()
-    
-    # Get 2024 data for comparison
-    df_2024 = df_sold[df_sold['Sale_Year'] == 2024].copy()
+    # Only the yearly medians and counts are used, so one grouped pass over
+    # 2024-2025 replaces two filtered copies and two calculate_market_stats calls
+    yearly_spec = {'total_sales': ('Sale_Year', 'size')}
+    if 'Selling Price' in df_sold.columns:
+        yearly_spec['median_price'] = ('Selling Price', 'median')
+    if 'DOM' in df_sold.columns:
+        yearly_spec['median_dom'] = ('DOM', 'median')
+    yearly_stats = (
+        df_sold[df_sold['Sale_Year'].isin((2024, 2025))]
+        .groupby('Sale_Year')
+        .agg(**yearly_spec)
+        .to_dict('index')
+    )
     
-    if len(df_2025) == 0:
+    if 2025 not in yearly_stats:
         return None, None, "No 2025 sales data available yet."
     
-    # Calculate key metrics
-    metrics_2025 = calculate_market_stats(df_2025)
-    metrics_2024 = calculate_market_stats(df_2024) if len(df_2024) > 0 else {}
-    
-    # Create simple comparison chart
-    comparison_data = []
-    
-    if metrics_2024:
-        comparison_data.append({
-            'Year': '2024',
-            'Median Price': metrics_2024.get('median_price', 0),
-            'Sales Count': len(df_2024),
-            'Avg Days on Market': metrics_2024.get('median_dom', 0)
-        })
-    
-    comparison_data.append({
-        'Year': '2025',
-        'Median Price': metrics_2025.get('median_price', 0),
-        'Sales Count': len(df_2025),
-        'Avg Days on Market': metrics_2025.get('median_dom', 0)
-    })
-    
-    comparison_df = pd.DataFrame(comparison_data)
+    # Key metrics per year
+    metrics_2025 = yearly_stats[2025]
+    metrics_2024 = yearly_stats.get(2024, {})
+    sales_2025 = int(metrics_2025['total_sales'])
+    sales_2024 = int(metrics_2024.get('total_sales', 0))
+    
+    # Comparison columns as plain lists - two rows don't need a DataFrame
+    comparison_data = {'Year': [], 'Median Price': [], 'Sales Count': [], 'Avg Days on Market': []}
+    for year, metrics, sales in (('2024', metrics_2024, sales_2024), ('2025', metrics_2025, sales_2025)):
+        if not metrics:
+            continue
+        comparison_data['Year'].append(year)
+        comparison_data['Median Price'].append(metrics.get('median_price', 0))
+        comparison_data['Sales Count'].append(sales)
+        comparison_data['Avg Days on Market'].append(metrics.get('median_dom', 0))
     
     # Create clear comparison chart
     fig = make_subplots(
@@ -266,11 +550,11 @@ def analyze_2025_market_trend(df_sold):
     # Price comparison
     fig.add_trace(
         go.Bar(
-            x=comparison_df['Year'], 
-            y=comparison_df['Median Price'],
+            x=comparison_data['Year'], 
+            y=comparison_data['Median Price'],
             name='Median Price',
             marker_color=['#ff7f0e', '#1f77b4'],
-            text=[f"${x:,.0f}" for x in comparison_df['Median Price']],
+            text=[f"${x:,.0f}" for x in comparison_data['Median Price']],
             textposition='auto',
             showlegend=False
         ),
@@ -280,11 +564,11 @@ def analyze_2025_market_trend(df_sold):
     # Sales count comparison
     fig.add_trace(
         go.Bar(
-            x=comparison_df['Year'], 
-            y=comparison_df['Sales Count'],
+            x=comparison_data['Year'], 
+            y=comparison_data['Sales Count'],
             name='Sales Count',
             marker_color=['#ff7f0e', '#1f77b4'],
-            text=comparison_df['Sales Count'],
+            text=comparison_data['Sales Count'],
             textposition='auto',
             showlegend=False
         ),
@@ -294,11 +578,11 @@ def analyze_2025_market_trend(df_sold):
     # DOM comparison
     fig.add_trace(
         go.Bar(
-            x=comparison_df['Year'], 
-            y=comparison_df['Avg Days on Market'],
+            x=comparison_data['Year'], 
+            y=comparison_data['Avg Days on Market'],
             name='Days on Market',
             marker_color=['#ff7f0e', '#1f77b4'],
-            text=[f"{x:.0f} days" for x in comparison_df['Avg Days on Market']],
+            text=[f"{x:.0f} days" for x in comparison_data['Avg Days on Market']],
             textposition='auto',
             showlegend=False
         ),
@@ -338,9 +622,6 @@ def analyze_2025_market_trend(df_sold):
                 insights.append(f"📊 **Stable Pricing**: {price_2025_formatted} (similar to 2024)")
     
     # Sales volume with clear explanation
-    sales_2025 = len(df_2025)
-    sales_2024 = len(df_2024)
-    
     if sales_2024 > 0:
         # Get current month to project full year
         current_month = datetime.now().month
@@ -360,17 +641,19 @@ def analyze_2025_market_trend(df_sold):
         else:
             insights.append(f"📊 **Similar Speed**: ~{dom_2025:.0f} days (consistent with 2024)")
     
-    return fig, comparison_df, insights
+    return fig, comparison_data, insights
 
+@st.cache_data(ttl=3600, hash_funcs=FRAME_HASH_FUNCS, show_spinner=False)
 def create_current_market_analysis(df_sold):
     """Analyze current market conditions"""
     if len(df_sold) == 0:
         return None
     
     # Get different time periods for comparison
-    recent_3m = get_recent_market_data(df_sold, 3)
-    recent_6m = get_recent_market_data(df_sold, 6)
-    recent_12m = get_recent_market_data(df_sold, 12)
+    recent_windows = get_recent_market_windows(df_sold, (3, 6, 12))
+    recent_3m = recent_windows[3]
+    recent_6m = recent_windows[6]
+    recent_12m = recent_windows[12]
     
     periods = {
         'Last 3 Months': recent_3m,
@@ -419,6 +702,13 @@ def create_current_market_analysis(df_sold):
     return fig
 
 def main():
+    # Only the active section's widgets are rendered, and Streamlit discards the
+    # state of keyed widgets that miss a run - re-assign the Net Proceeds inputs
+    # so they keep the user's values while another section is shown
+    for key in NET_PROCEEDS_WIDGET_KEYS:
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
+    
     # App header
     st.markdown('<h1 class="main-header">🏠 Neighborhood Real Estate Analysis</h1>', unsafe_allow_html=True)
     
@@ -437,10 +727,14 @@ def main():
     rebecca_data = available_datasets.get('Rebecca Ridge', {})
     sunrise_data = available_datasets.get('Sunrise Area', {})
     
+    # Dict key views are set-like, so this is a hashed subset check
+    both_datasets_available = {'Rebecca Ridge', 'Sunrise Area'} <= available_datasets.keys()
+    
     # Use broader Sunrise data as primary, Rebecca Ridge as context
     if sunrise_data and rebecca_data:
         df_all = sunrise_data['all']
         df_sold = sunrise_data['sold']
+        filter_bounds = sunrise_data['filter_bounds']
         primary_description = "Sunrise Area & Rebecca Ridge Combined Analysis"
         
         # Show combined market info in sidebar
@@ -466,10 +760,12 @@ def main():
     elif rebecca_data:
         df_all = rebecca_data['all']
         df_sold = rebecca_data['sold']
+        filter_bounds = rebecca_data['filter_bounds']
         primary_description = rebecca_data['description']
     elif sunrise_data:
         df_all = sunrise_data['all']
         df_sold = sunrise_data['sold']
+        filter_bounds = sunrise_data['filter_bounds']
         primary_description = sunrise_data['description']
     else:
         st.error("No data available")
@@ -485,13 +781,15 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Sidebar filters
+    # Sidebar filters - each widget narrows one boolean mask, and the frame is
+    # indexed once at the end. Widget bounds are the cached unfiltered ones.
     st.sidebar.header("🔍 Additional Filters")
+    mask = np.ones(len(df_sold), dtype=bool)
     
     # Date range filter
-    if 'Selling Date' in df_sold.columns and len(df_sold) > 0:
-        min_date = df_sold['Selling Date'].min().date()
-        max_date = df_sold['Selling Date'].max().date()
+    if 'date_min' in filter_bounds:
+        min_date = filter_bounds['date_min']
+        max_date = filter_bounds['date_max']
         
         date_range = st.sidebar.date_input(
             "Select Date Range",
@@ -502,26 +800,27 @@ def main():
         
         if len(date_range) == 2:
             start_date, end_date = date_range
-            df_sold = df_sold[
-                (df_sold['Selling Date'].dt.date >= start_date) & 
-                (df_sold['Selling Date'].dt.date <= end_date)
-            ]
+            # Compare as timestamps; the end bound is exclusive at the next midnight
+            start_ts = pd.Timestamp(start_date)
+            end_ts = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+            dates = df_sold['Selling Date']
+            mask &= ((dates >= start_ts) & (dates < end_ts)).to_numpy()
     
     # Property type filter
-    if 'Property Sub Type' in df_sold.columns:
-        property_types = df_sold['Property Sub Type'].dropna().unique()
+    if 'types' in filter_bounds:
+        property_types = filter_bounds['types']
         if len(property_types) > 1:
             selected_types = st.sidebar.multiselect(
                 "Property Types",
                 options=property_types,
                 default=property_types
             )
-            df_sold = df_sold[df_sold['Property Sub Type'].isin(selected_types)]
+            mask &= df_sold['Property Sub Type'].isin(selected_types).to_numpy()
     
     # Price range filter
-    if 'Selling Price' in df_sold.columns and len(df_sold) > 0:
-        min_price = int(df_sold['Selling Price'].min())
-        max_price = int(df_sold['Selling Price'].max())
+    if 'price_min' in filter_bounds:
+        min_price = filter_bounds['price_min']
+        max_price = filter_bounds['price_max']
         
         price_range = st.sidebar.slider(
             "Price Range ($)",
@@ -532,37 +831,47 @@ def main():
             format="$%d"
         )
         
-        df_sold = df_sold[
-            (df_sold['Selling Price'] >= price_range[0]) & 
-            (df_sold['Selling Price'] <= price_range[1])
-        ]
+        prices = df_sold['Selling Price']
+        mask &= ((prices >= price_range[0]) & (prices <= price_range[1])).to_numpy()
+    
+    df_sold = df_sold[mask]
     
     # Main content
     if len(df_sold) == 0:
         st.warning("No data available for the selected filters.")
         return
     
-    # Create top-level tabs for the entire analysis
-    summary_tab, analysis_tab, pricing_tab, proceeds_tab = st.tabs(["📋 Executive Summary", "📈 Market Analysis", "💰 Price Recommendation", "📊 Net Proceeds"])
+    # Recent windows shared by every section below
+    recent_windows = get_recent_market_windows(df_sold, (3, 12, 24))
+    
+    # Top-level section selector - st.tabs runs every tab body on each rerun,
+    # so only the selected section is rendered
+    active_tab = st.radio(
+        "Section",
+        options=["📋 Executive Summary", "📈 Market Analysis", "💰 Price Recommendation", "📊 Net Proceeds"],
+        horizontal=True,
+        key="active_tab",
+        label_visibility="collapsed"
+    )
     
     # === EXECUTIVE SUMMARY TAB ===
-    with summary_tab:
+    if active_tab == "📋 Executive Summary":
         # Header
         st.markdown("""
-        <div style="background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); padding: 2rem; border-radius: 1rem; margin-bottom: 2rem; border-left: 4px solid #007bff;">
-            <h1 style="margin: 0; color: #495057; font-size: 2.2em;">📋 Executive Summary</h1>
-            <h3 style="margin: 0.5rem 0 0 0; color: #6c757d;">12903 158th Street Ct E Market Analysis</h3>
-            <p style="margin: 0.5rem 0 0 0; color: #6c757d; font-style: italic;">Comprehensive real estate market overview and pricing strategy</p>
-            <p style="margin: 1rem 0 0 0; color: #6c757d; font-size: 0.9em;">Prepared by Nathan Coons, Managing Broker - Washington Realty Group</p>
+        <div class="card-banner">
+            <h1>📋 Executive Summary</h1>
+            <h3>12903 158th Street Ct E Market Analysis</h3>
+            <p>Comprehensive real estate market overview and pricing strategy</p>
+            <p class="byline">Prepared by Nathan Coons, Managing Broker - Washington Realty Group</p>
         </div>
         """, unsafe_allow_html=True)
         
         # Get pricing data for summary
-        if len(available_datasets) > 1:
-            sunrise_sold = sunrise_data.get('sold', pd.DataFrame())
-            rebecca_sold = rebecca_data.get('sold', pd.DataFrame())
+        if both_datasets_available:
+            sunrise_sold = sunrise_data['sold']
+            rebecca_sold = rebecca_data['sold']
             pricing = analyze_premium_home_pricing(sunrise_sold, rebecca_sold, 1576)
-            recent_data = get_recent_market_data(df_sold, 12)
+            recent_data = recent_windows[12]
             recent_stats = calculate_market_stats(recent_data)
             
             if pricing:
@@ -591,9 +900,9 @@ def main():
                 
                 # Market Timing Alert Box - More Visible
                 st.markdown("""
-                <div style="background-color: #fff3cd; padding: 1.5rem; border-radius: 0.8rem; border-left: 4px solid #ffc107; margin: 2rem 0; border: 1px solid #ffeaa7;">
-                    <h4 style="margin: 0 0 0.5rem 0; color: #856404;"><i>⚠️ Market Timing Alert</i></h4>
-                    <p style="margin: 0; color: #856404; font-weight: 500;">
+                <div class="card-alert">
+                    <h4><i>⚠️ Market Timing Alert</i></h4>
+                    <p>
                         The real estate market is moving every day and appears to be slipping. While current conditions favor sellers in your size segment, <strong>this window may not stick around</strong>. Acting decisively on pricing and marketing strategy is essential to capitalize on present market conditions before they shift.
                     </p>
                 </div>
@@ -615,13 +924,14 @@ def main():
             st.warning("⚠️ Executive summary requires both Rebecca Ridge and Sunrise datasets")
     
     # === MARKET ANALYSIS TAB ===
-    with analysis_tab:
+    elif active_tab == "📈 Market Analysis":
         # Key metrics overview - simplified for client presentation
         st.header("📊 Current Market Snapshot")
         st.markdown("*Based on Sunrise area data (1,100-1,900 sq ft, 2+ story, built through 2020, last 12 months)*")
         
-        recent_data = get_recent_market_data(df_sold, 12)
+        recent_data = recent_windows[12]
         recent_stats = calculate_market_stats(recent_data)
+        sunrise_median = f"${recent_stats.get('median_price', 0):,.0f}"
         
         # More prominent display of key metrics
         col1, col2, col3 = st.columns(3)
@@ -679,9 +989,9 @@ def main():
         
         # Market Timing Alert in Analysis Tab
         st.markdown("""
-        <div style="background-color: #fff3cd; padding: 1.5rem; border-radius: 0.8rem; border-left: 4px solid #ffc107; margin: 2rem 0; border: 1px solid #ffeaa7;">
-            <h4 style="margin: 0 0 0.5rem 0; color: #856404;"><i>⚠️ Market Timing Alert</i></h4>
-            <p style="margin: 0; color: #856404; font-weight: 500;">
+        <div class="card-alert">
+            <h4><i>⚠️ Market Timing Alert</i></h4>
+            <p>
                 Market conditions are shifting daily. Current seller-favorable trends in your size segment may not persist. <strong>Time-sensitive opportunity</strong> - act quickly while conditions remain favorable.
             </p>
         </div>
@@ -695,7 +1005,7 @@ def main():
         Look for patterns in pricing cycles, seasonal trends, and overall market direction.
         """)
         
-        price_chart = create_price_trend_chart(df_sold)
+        price_chart = create_price_trend_chart(compute_monthly_aggregates(df_sold))
         if price_chart:
             st.plotly_chart(price_chart, use_container_width=True)
             
@@ -741,27 +1051,8 @@ def main():
             top_size_sales = get_top_sales(size_filtered, 5)
             
             if not top_size_sales.empty:
-                # Create horizontal tiles layout
-                cols = st.columns(min(len(top_size_sales), 5))
-                
-                for idx, (_, row) in enumerate(top_size_sales.iterrows()):
-                    if idx < 5:  # Limit to 5 columns
-                        with cols[idx]:
-                            # Use appropriate price field based on status
-                            price = row.get('Analysis_Price', row.get('Selling Price', 0))
-                            st.markdown(f"""
-                            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1.5rem; border-radius: 1rem; text-align: center; margin: 0.5rem 0;">
-                                <h3 style="margin: 0; color: white; font-size: 1.4em;">${price:,.0f}</h3>
-                                <hr style="border-color: rgba(255,255,255,0.3); margin: 1rem 0;">
-                                <p style="margin: 0.5rem 0; color: white; font-weight: bold;">{row.get('Full_Address', 'N/A')}</p>
-                                <p style="margin: 0; color: rgba(255,255,255,0.9); font-size: 0.9em;">
-                                    {row.get('Finished Sqft', 'N/A'):.0f} sq ft<br>
-                                    {row.get('Bedrooms', 'N/A'):.0f}bed/{row.get('Bathrooms', 'N/A'):.1f}bath<br>
-                                    {row.get('Status', 'N/A')}<br>
-                                    {row.get('Selling Date', 'N/A').strftime('%b %Y') if pd.notna(row.get('Selling Date')) else 'Recent'}
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                # Create horizontal tiles layout in a single element
+                st.markdown(top_sales_tiles_html(top_size_sales, "tile-purple"), unsafe_allow_html=True)
                 
                 st.markdown("**💡 Direct Comparables:** These homes match your exact square footage range and represent your most direct competition.")
             else:
@@ -773,27 +1064,8 @@ def main():
                 rebecca_top_sales = get_top_sales(rebecca_data['sold'], 5)
                 
                 if not rebecca_top_sales.empty:
-                    # Create horizontal tiles layout
-                    cols = st.columns(min(len(rebecca_top_sales), 5))
-                    
-                    for idx, (_, row) in enumerate(rebecca_top_sales.iterrows()):
-                        if idx < 5:  # Limit to 5 columns
-                            with cols[idx]:
-                                # Use appropriate price field based on status
-                                price = row.get('Analysis_Price', row.get('Selling Price', 0))
-                                st.markdown(f"""
-                                <div style="background: linear-gradient(135deg, #28a745 0%, #20c997 100%); color: white; padding: 1.5rem; border-radius: 1rem; text-align: center; margin: 0.5rem 0;">
-                                    <h3 style="margin: 0; color: white; font-size: 1.4em;">${price:,.0f}</h3>
-                                    <hr style="border-color: rgba(255,255,255,0.3); margin: 1rem 0;">
-                                    <p style="margin: 0.5rem 0; color: white; font-weight: bold;">{row.get('Full_Address', 'N/A')}</p>
-                                    <p style="margin: 0; color: rgba(255,255,255,0.9); font-size: 0.9em;">
-                                        {row.get('Finished Sqft', 'N/A'):.0f} sq ft<br>
-                                        {row.get('Bedrooms', 'N/A'):.0f}bed/{row.get('Bathrooms', 'N/A'):.1f}bath<br>
-                                        {row.get('Status', 'N/A')}<br>
-                                        {row.get('Selling Date', 'N/A').strftime('%b %Y') if pd.notna(row.get('Selling Date')) else 'Recent'}
-                                    </p>
-                                </div>
-                                """, unsafe_allow_html=True)
+                    # Create horizontal tiles layout in a single element
+                    st.markdown(top_sales_tiles_html(rebecca_top_sales, "tile-green"), unsafe_allow_html=True)
                     
                     st.markdown("**💡 Neighborhood Performance:** The highest achievers specifically within Rebecca Ridge, showing local market potential.")
                 else:
@@ -806,27 +1078,8 @@ def main():
             top_sunrise_sales = get_top_sales(df_sold, 5)
             
             if not top_sunrise_sales.empty:
-                # Create horizontal tiles layout
-                cols = st.columns(min(len(top_sunrise_sales), 5))
-                
-                for idx, (_, row) in enumerate(top_sunrise_sales.iterrows()):
-                    if idx < 5:  # Limit to 5 columns
-                        with cols[idx]:
-                            # Use appropriate price field based on status
-                            price = row.get('Analysis_Price', row.get('Selling Price', 0))
-                            st.markdown(f"""
-                            <div style="background: linear-gradient(135deg, #ff7f0e 0%, #ff6b6b 100%); color: white; padding: 1.5rem; border-radius: 1rem; text-align: center; margin: 0.5rem 0;">
-                                <h3 style="margin: 0; color: white; font-size: 1.4em;">${price:,.0f}</h3>
-                                <hr style="border-color: rgba(255,255,255,0.3); margin: 1rem 0;">
-                                <p style="margin: 0.5rem 0; color: white; font-weight: bold;">{row.get('Full_Address', 'N/A')}</p>
-                                <p style="margin: 0; color: rgba(255,255,255,0.9); font-size: 0.9em;">
-                                    {row.get('Finished Sqft', 'N/A'):.0f} sq ft<br>
-                                    {row.get('Bedrooms', 'N/A'):.0f}bed/{row.get('Bathrooms', 'N/A'):.1f}bath<br>
-                                    {row.get('Status', 'N/A')}<br>
-                                    {row.get('Selling Date', 'N/A').strftime('%b %Y') if pd.notna(row.get('Selling Date')) else 'Recent'}
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                # Create horizontal tiles layout in a single element
+                st.markdown(top_sales_tiles_html(top_sunrise_sales, "tile-orange"), unsafe_allow_html=True)
                 
                 st.markdown("**💡 Market Ceiling:** The highest achievers across the broader Sunrise market, showing regional premium potential.")
             else:
@@ -875,33 +1128,12 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            recent_3m = get_recent_market_data(df_sold, 3)
+            recent_3m = recent_windows[3]
             recent_dom = recent_3m['DOM'].median() if len(recent_3m) > 0 and 'DOM' in recent_3m.columns else 0
             
-            if recent_dom <= 30:
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #e8f5e8 0%, #4caf50 100%); padding: 1.5rem; border-radius: 0.5rem; margin: 1rem 0; border-left: 4px solid #4caf50;">
-                    <h4 style="margin: 0; color: #2e7d32;">🔥 Fast Market</h4>
-                    <p style="margin: 0.5rem 0; font-size: 1.1em;">Homes sell in <strong>{recent_dom:.0f} days</strong></p>
-                    <p style="margin: 0; color: #2e7d32;"><em>Sellers' market conditions</em></p>
-                </div>
-                """, unsafe_allow_html=True)
-            elif recent_dom <= 60:
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #fff3e0 0%, #ffcc02 100%); padding: 1.5rem; border-radius: 0.5rem; margin: 1rem 0; border-left: 4px solid #ff9800;">
-                    <h4 style="margin: 0; color: #e65100;">📊 Balanced Market</h4>
-                    <p style="margin: 0.5rem 0; font-size: 1.1em;">Homes sell in <strong>{recent_dom:.0f} days</strong></p>
-                    <p style="margin: 0; color: #e65100;"><em>Normal market conditions</em></p>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #fce4ec 0%, #f8bbd9 100%); padding: 1.5rem; border-radius: 0.5rem; margin: 1rem 0; border-left: 4px solid #e91e63;">
-                    <h4 style="margin: 0; color: #ad1457;">🐌 Slower Market</h4>
-                    <p style="margin: 0.5rem 0; font-size: 1.1em;">Homes sell in <strong>{recent_dom:.0f} days</strong></p>
-                    <p style="margin: 0; color: #ad1457;"><em>Buyers' market conditions</em></p>
-                </div>
-                """, unsafe_allow_html=True)
+            # Bucket index 0/1/2; a missing median (no DOM values) counts as slow
+            velocity_bucket = 2 if pd.isna(recent_dom) else int(recent_dom > 30) + int(recent_dom > 60)
+            st.markdown(VELOCITY_TEMPLATES[velocity_bucket].format(dom=recent_dom), unsafe_allow_html=True)
         
         # === SECTION 6: STRATEGIC INSIGHTS ===
         st.markdown("---")
@@ -912,8 +1144,8 @@ def main():
         """)
         
         # Focus on recent data only for strategic insights
-        recent_24m = get_recent_market_data(df_sold, 24)  # Last 2 years
-        recent_12m = get_recent_market_data(df_sold, 12)  # Last 12 months
+        recent_24m = recent_windows[24]  # Last 2 years
+        recent_12m = recent_windows[12]  # Last 12 months
         
         if len(recent_12m) == 0:
             st.info("Insufficient recent market data for strategic insights.")
@@ -1011,41 +1243,47 @@ def main():
         st.markdown("*Analysis based on Sunrise area data (1,100-1,900 sq ft, 2+ story, built through 2020)*")
     
     # === PRICING TAB ===
-    with pricing_tab:
+    elif active_tab == "💰 Price Recommendation":
         # Market Timing Alert at top of pricing tab
         st.markdown("""
-        <div style="background-color: #fff3cd; padding: 1.5rem; border-radius: 0.8rem; border-left: 4px solid #ffc107; margin: 2rem 0; border: 1px solid #ffeaa7;">
-            <h4 style="margin: 0 0 0.5rem 0; color: #856404;"><i>⚠️ Market Timing Alert</i></h4>
-            <p style="margin: 0; color: #856404; font-weight: 500;">
+        <div class="card-alert">
+            <h4><i>⚠️ Market Timing Alert</i></h4>
+            <p>
                 Market conditions are shifting daily and appear to be slipping. <strong>This pricing window may not last</strong>. Quick action on pricing strategy is essential to capitalize on current market conditions.
             </p>
         </div>
         """, unsafe_allow_html=True)
-        if len(available_datasets) > 1:  # Show when both datasets available
+        if both_datasets_available:  # Show when both datasets available
             # Header with property details
             st.markdown("""
-            <div style="background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); padding: 2rem; border-radius: 1rem; margin-bottom: 2rem; border-left: 4px solid #007bff;">
-                <h1 style="margin: 0; color: #495057; font-size: 2.2em;">🏠 Premium Home Pricing Analysis</h1>
-                <h3 style="margin: 0.5rem 0 0 0; color: #6c757d;">12903 158th Street Ct E, Puyallup WA</h3>
-                <p style="margin: 0.5rem 0 0 0; color: #6c757d; font-style: italic;">Extensively remodeled luxury home • 1,576 sq ft • 3 bed, 2.5 bath • Built 2000</p>
-                <p style="margin: 1rem 0 0 0; color: #6c757d; font-size: 0.9em;">Prepared by Nathan Coons, Managing Broker - Washington Realty Group</p>
+            <div class="card-banner">
+                <h1>🏠 Premium Home Pricing Analysis</h1>
+                <h3>12903 158th Street Ct E, Puyallup WA</h3>
+                <p>Extensively remodeled luxury home • 1,576 sq ft • 3 bed, 2.5 bath • Built 2000</p>
+                <p class="byline">Prepared by Nathan Coons, Managing Broker - Washington Realty Group</p>
             </div>
             """, unsafe_allow_html=True)
             
             # Get both datasets for analysis
-            sunrise_sold = sunrise_data.get('sold', pd.DataFrame())
-            rebecca_sold = rebecca_data.get('sold', pd.DataFrame())
+            sunrise_sold = sunrise_data['sold']
+            rebecca_sold = rebecca_data['sold']
             
             # Calculate pricing analysis using broader market (fixed at 1600 sq ft)
             pricing = analyze_premium_home_pricing(sunrise_sold, rebecca_sold, 1576)
             
             if pricing:
+                # Pre-format price values used in the cards below
+                recent_stats = calculate_market_stats(recent_windows[12])
+                recommended_price = f"${pricing['recommended_price']:,.0f}"
+                sunrise_median = f"${recent_stats.get('median_price', 0):,.0f}"
+                rebecca_median = f"${pricing['rebecca_median']:,.0f}"
+                
                 # MAIN PRICING RECOMMENDATION - Full Width
                 st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #007bff 0%, #0056b3 100%); color: white; padding: 3rem; border-radius: 1rem; text-align: center; margin: 2rem 0;">
-                    <h2 style="margin: 0; color: white; font-weight: 300; opacity: 0.9;">🎯 Recommended List Price</h2>
-                    <h1 style="margin: 1rem 0; color: white; font-size: 3.5em; font-weight: bold;">{recommended_price}</h1>
-                    <p style="margin: 0; color: white; opacity: 0.9; font-size: 1.2em;">Premium luxury home pricing strategy</p>
+                <div class="card-price">
+                    <h2>🎯 Recommended List Price</h2>
+                    <h1>{recommended_price}</h1>
+                    <p>Premium luxury home pricing strategy</p>
                 </div>
                 """, unsafe_allow_html=True)
                 
@@ -1058,19 +1296,19 @@ def main():
                 
                 with col1:
                     st.markdown(f"""
-                    <div style="background-color: #f8f9fa; padding: 1.5rem; border-radius: 0.8rem; text-align: center; border: 1px solid #dee2e6;">
-                        <h4 style="margin: 0; color: #495057;">Market Premium</h4>
-                        <h2 style="margin: 0.5rem 0; color: #28a745;">+{sunrise_premium:.0f}%</h2>
-                        <p style="margin: 0; color: #6c757d; font-size: 0.9em;">Above Sunrise median</p>
+                    <div class="card-metric">
+                        <h4>Market Premium</h4>
+                        <h2 class="text-green">+{sunrise_premium:.0f}%</h2>
+                        <p>Above Sunrise median</p>
                     </div>
                     """, unsafe_allow_html=True)
                 
                 with col2:
                     st.markdown(f"""
-                    <div style="background-color: #f8f9fa; padding: 1.5rem; border-radius: 0.8rem; text-align: center; border: 1px solid #dee2e6;">
-                        <h4 style="margin: 0; color: #495057;">Price per SqFt</h4>
-                        <h2 style="margin: 0.5rem 0; color: #007bff;">${pricing['premium_psf']:.0f}</h2>
-                        <p style="margin: 0; color: #6c757d; font-size: 0.9em;">Premium positioning</p>
+                    <div class="card-metric">
+                        <h4>Price per SqFt</h4>
+                        <h2 class="text-blue">${pricing['premium_psf']:.0f}</h2>
+                        <p>Premium positioning</p>
                     </div>
                     """, unsafe_allow_html=True)
                 
@@ -1089,11 +1327,11 @@ def main():
                         speed_color = "#6c757d"
                     
                     st.markdown(f"""
-                    <div style="background-color: #f8f9fa; padding: 1.5rem; border-radius: 0.8rem; text-align: center; border: 1px solid #dee2e6;">
-                        <h4 style="margin: 0; color: #495057;">Market Speed</h4>
-                        <h2 style="margin: 0.5rem 0; color: {speed_color};">{pricing['sunrise_dom']:.0f} days</h2>
-                        <p style="margin: 0; color: #6c757d; font-size: 0.9em;">{market_speed}</p>
-                        <p style="margin: 0.5rem 0 0 0; color: #6c757d; font-size: 0.8em; font-style: italic;">Premium luxury homes typically take 30-60 days</p>
+                    <div class="card-metric">
+                        <h4>Market Speed</h4>
+                        <h2 style="color: {speed_color};">{pricing['sunrise_dom']:.0f} days</h2>
+                        <p>{market_speed}</p>
+                        <p class="note">Premium luxury homes typically take 30-60 days</p>
                     </div>
                     """, unsafe_allow_html=True)
                 
@@ -1107,9 +1345,9 @@ def main():
                     
                     # Structural & Systems section
                     st.markdown("""
-                    <div style="background-color: #f8f9fa; padding: 1.2rem; border-radius: 0.6rem; border-left: 4px solid #007bff; margin-bottom: 1rem;">
-                        <h5 style="margin: 0 0 0.8rem 0; color: #495057;">🏠 Structural & Systems</h5>
-                        <div style="color: #495057;">
+                    <div class="card-feature">
+                        <h5>🏠 Structural & Systems</h5>
+                        <div>
                             • <strong>New roof</strong> - Complete replacement<br>
                             • <strong>New AC system</strong> - Modern HVAC<br>
                             • <strong>Custom built staircase</strong> - Architectural feature<br>
@@ -1120,9 +1358,9 @@ def main():
                     
                     # Interior Luxury section
                     st.markdown("""
-                    <div style="background-color: #f8f9fa; padding: 1.2rem; border-radius: 0.6rem; border-left: 4px solid #28a745;">
-                        <h5 style="margin: 0 0 0.8rem 0; color: #495057;">✨ Interior Luxury</h5>
-                        <div style="color: #495057;">
+                    <div class="card-feature accent-green">
+                        <h5>✨ Interior Luxury</h5>
+                        <div>
                             • <strong>Luxury kitchen remodel</strong> - High-end finishes<br>
                             • <strong>Custom master suite</strong> - Completely redesigned<br>
                             • <strong>Spa-like custom shower</strong> - Luxury experience<br>
@@ -1136,7 +1374,7 @@ def main():
                     """, unsafe_allow_html=True)
                     
                     st.markdown(f"""
-                    <div style="background-color: #e8f4f8; padding: 1rem; border-radius: 0.5rem; margin-top: 1rem;">
+                    <div class="card-note">
                         <strong>💡 Investment Summary:</strong> Over $100,000 in premium upgrades justify the {sunrise_premium:.0f}% premium positioning above standard market rates.
                     </div>
                     """, unsafe_allow_html=True)
@@ -1145,26 +1383,26 @@ def main():
                     st.markdown("### 📊 Market Context")
                     
                     st.markdown(f"""
-                    <div style="background-color: #f8f9fa; padding: 1rem; border-radius: 0.5rem; border-left: 4px solid #6c757d; margin-bottom: 1rem;">
+                    <div class="card-context">
                         <strong>Sunrise Area Median:</strong><br>
-                        <span style="color: #007bff; font-size: 1.1em;">{sunrise_median}</span><br>
-                        <small style="color: #6c757d;">(broader market baseline)</small>
+                        <span class="value text-blue">{sunrise_median}</span><br>
+                        <small>(broader market baseline)</small>
                     </div>
                     """, unsafe_allow_html=True)
                     
                     st.markdown(f"""
-                    <div style="background-color: #f8f9fa; padding: 1rem; border-radius: 0.5rem; border-left: 4px solid #6c757d; margin-bottom: 1rem;">
+                    <div class="card-context">
                         <strong>Rebecca Ridge Median:</strong><br>
-                        <span style="color: #28a745; font-size: 1.1em;">{rebecca_median}</span><br>
-                        <small style="color: #6c757d;">(neighborhood context)</small>
+                        <span class="value text-green">{rebecca_median}</span><br>
+                        <small>(neighborhood context)</small>
                     </div>
                     """, unsafe_allow_html=True)
                     
                     st.markdown(f"""
-                    <div style="background-color: #f8f9fa; padding: 1rem; border-radius: 0.5rem; border-left: 4px solid #6c757d;">
+                    <div class="card-context">
                         <strong>Strategic Timing:</strong><br>
-                        <span style="color: #495057;">{timing_strategy}</span><br>
-                        <small style="color: #6c757d;">Market conditions favor sellers</small>
+                        <span>{timing_strategy}</span><br>
+                        <small>Market conditions favor sellers</small>
                     </div>
                     """, unsafe_allow_html=True)
                 
@@ -1176,58 +1414,28 @@ def main():
                 
                 with comp_col1:
                     st.markdown("**🌅 Sunrise Area Recent Sales**")
+                    # One placeholder per column so the cards update in place on reruns
+                    sunrise_slot = st.empty()
                     if len(pricing['sunrise_top']) > 0:
-                        for idx, (_, row) in enumerate(pricing['sunrise_top'].iterrows()):
-                            price = row['Selling Price']
-                            sqft = row.get('Finished Sqft', 0)
-                            psf = price / sqft if sqft > 0 else 0
-                            date = row.get('Selling Date', 'Unknown')
-                            if pd.notna(date):
-                                date = date.strftime('%b %Y')
-                            
-                            mls = row.get('Listing Number', 'N/A')
-                            address = row.get('Full_Address', 'N/A')
-                            
-                            st.markdown(f"""
-                            <div style="background-color: #f8f9fa; padding: 0.8rem; border-radius: 0.4rem; margin: 0.5rem 0; border-left: 3px solid #007bff;">
-                                <strong>${price:,.0f}</strong> • {sqft:.0f} sq ft • ${psf:.0f}/sq ft<br>
-                                <strong>{address}</strong><br>
-                                <small style="color: #6c757d;">MLS #{mls} • {date}</small>
-                            </div>
-                            """, unsafe_allow_html=True)
+                        sunrise_slot.markdown(comparable_cards_html(pricing['sunrise_top'], 'accent-blue'), unsafe_allow_html=True)
                     else:
-                        st.info("No comparable sales data available")
+                        sunrise_slot.info("No comparable sales data available")
                 
                 with comp_col2:
                     st.markdown("**🏘️ Rebecca Ridge Recent Sales**")
+                    # One placeholder per column so the cards update in place on reruns
+                    rebecca_slot = st.empty()
                     if len(pricing['rebecca_top']) > 0:
-                        for idx, (_, row) in enumerate(pricing['rebecca_top'].iterrows()):
-                            price = row['Selling Price']
-                            sqft = row.get('Finished Sqft', 0)
-                            psf = price / sqft if sqft > 0 else 0
-                            date = row.get('Selling Date', 'Unknown')
-                            if pd.notna(date):
-                                date = date.strftime('%b %Y')
-                            
-                            mls = row.get('Listing Number', 'N/A')
-                            address = row.get('Full_Address', 'N/A')
-                            
-                            st.markdown(f"""
-                            <div style="background-color: #f8f9fa; padding: 0.8rem; border-radius: 0.4rem; margin: 0.5rem 0; border-left: 3px solid #28a745;">
-                                <strong>${price:,.0f}</strong> • {sqft:.0f} sq ft • ${psf:.0f}/sq ft<br>
-                                <strong>{address}</strong><br>
-                                <small style="color: #6c757d;">MLS #{mls} • {date}</small>
-                            </div>
-                            """, unsafe_allow_html=True)
+                        rebecca_slot.markdown(comparable_cards_html(pricing['rebecca_top'], 'accent-green'), unsafe_allow_html=True)
                     else:
-                        st.info("No comparable sales data available")
+                        rebecca_slot.info("No comparable sales data available")
                 
                 # FINAL STRATEGY SUMMARY
                 st.markdown("---")
                 st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); padding: 2rem; border-radius: 1rem; border-left: 4px solid #007bff; margin: 2rem 0;">
-                    <h4 style="margin: 0 0 1rem 0; color: #495057;">🎯 Final Recommendation</h4>
-                    <p style="margin: 0; color: #495057; font-size: 1.1em; line-height: 1.6;">
+                <div class="card-final">
+                    <h4>🎯 Final Recommendation</h4>
+                    <p>
                         <strong>List at ${pricing['recommended_price']:,.0f}</strong> to position as a premium luxury option while remaining competitive within the established market range. 
                         The extensive remodel and custom features justify the {sunrise_premium:.0f}% premium over the broader Sunrise market median.
                     </p>
@@ -1240,35 +1448,40 @@ def main():
             st.warning("⚠️ Both Rebecca Ridge and Sunrise datasets needed for pricing analysis.")
     
     # === NET PROCEEDS TAB ===
-    with proceeds_tab:
+    elif active_tab == "📊 Net Proceeds":
         # Market Timing Alert at top of net proceeds tab
         st.markdown("""
-        <div style="background-color: #fff3cd; padding: 1.5rem; border-radius: 0.8rem; border-left: 4px solid #ffc107; margin: 2rem 0; border: 1px solid #ffeaa7;">
-            <h4 style="margin: 0 0 0.5rem 0; color: #856404;"><i>⚠️ Market Timing Alert</i></h4>
-            <p style="margin: 0; color: #856404; font-weight: 500;">
+        <div class="card-alert">
+            <h4><i>⚠️ Market Timing Alert</i></h4>
+            <p>
                 Market conditions are changing rapidly. <strong>Current pricing may not hold</strong> if market continues to slip. Consider these proceeds calculations as time-sensitive projections.
             </p>
         </div>
         """, unsafe_allow_html=True)
         
-        if len(available_datasets) > 1:
+        if both_datasets_available:
             # Get pricing data
-            sunrise_sold = sunrise_data.get('sold', pd.DataFrame())
-            rebecca_sold = rebecca_data.get('sold', pd.DataFrame())
+            sunrise_sold = sunrise_data['sold']
+            rebecca_sold = rebecca_data['sold']
             pricing = analyze_premium_home_pricing(sunrise_sold, rebecca_sold, 1576)
             
             if pricing:
                 st.header("💰 Net Proceeds Calculator")
                 st.markdown("*Calculate your actual take-home amount after all selling costs*")
                 
-                # Use recommended price as default but allow adjustment
+                # Seed the inputs once through session state (recommended price as
+                # the default sale price); after that they keep the user's values
+                st.session_state.setdefault("net_sale_price", int(pricing['recommended_price']))
+                for key, default in NET_PROCEEDS_DEFAULTS.items():
+                    st.session_state.setdefault(key, default)
+                
                 final_sale_price = st.number_input(
                     "Final Sale Price", 
                     min_value=400000, 
                     max_value=800000, 
-                    value=int(pricing['recommended_price']), 
                     step=5000,
-                    help="Adjust this to see how different sale prices affect your net proceeds"
+                    help="Adjust this to see how different sale prices affect your net proceeds",
+                    key="net_sale_price"
                 )
                 
                 # Selling costs inputs
@@ -1277,24 +1490,24 @@ def main():
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    listing_agent_rate = st.slider("Listing Agent Compensation (%)", 1.0, 4.0, 2.5, 0.25)
-                    selling_agent_rate = st.slider("Selling Agent Compensation (%)", 0.0, 4.0, 2.5, 0.25, help="Not mandatory - set to 0 if not offering")
+                    listing_agent_rate = st.slider("Listing Agent Compensation (%)", 1.0, 4.0, step=0.25, key="net_listing_agent_rate")
+                    selling_agent_rate = st.slider("Selling Agent Compensation (%)", 0.0, 4.0, step=0.25, help="Not mandatory - set to 0 if not offering", key="net_selling_agent_rate")
                     commission_rate = listing_agent_rate + selling_agent_rate
-                    title_insurance = st.number_input("Title Insurance", value=1300, step=100)
-                    escrow_fees = st.number_input("Escrow Fees", value=1400, step=100)
-                    mortgage_payoff = st.number_input("Mortgage Payoff", value=285000, step=1000, help="Remaining balance on current mortgage")
+                    title_insurance = st.number_input("Title Insurance", step=100, key="net_title_insurance")
+                    escrow_fees = st.number_input("Escrow Fees", step=100, key="net_escrow_fees")
+                    mortgage_payoff = st.number_input("Mortgage Payoff", step=1000, help="Remaining balance on current mortgage", key="net_mortgage_payoff")
                     
                 with col2:
-                    transfer_tax = st.number_input("Transfer Tax/Recording", value=500, step=50)
-                    excise_tax = st.number_input("Excise Tax", value=9000, step=100, help="Washington state real estate excise tax")
-                    misc_fees = st.number_input("Misc. Closing Costs", value=300, step=50)
+                    transfer_tax = st.number_input("Transfer Tax/Recording", step=50, key="net_transfer_tax")
+                    excise_tax = st.number_input("Excise Tax", step=100, help="Washington state real estate excise tax", key="net_excise_tax")
+                    misc_fees = st.number_input("Misc. Closing Costs", step=50, key="net_misc_fees")
                 
                 # Seller concessions
                 concessions = st.number_input(
                     "Buyer Concessions (if any)", 
-                    value=0, 
                     step=1000,
-                    help="Amount you agree to pay toward buyer's closing costs"
+                    help="Amount you agree to pay toward buyer's closing costs",
+                    key="net_concessions"
                 )
                 
                 # Calculate proceeds
@@ -1326,22 +1539,26 @@ def main():
                 
                 with col2:
                     st.markdown(f"""
-                    <div style="background: linear-gradient(135deg, #28a745, #20c997); color: white; padding: 2rem; border-radius: 1rem; text-align: center;">
-                        <h3 style="margin: 0; color: white;">💰 Net Proceeds</h3>
-                        <h1 style="margin: 1rem 0; color: white; font-size: 2.2em;">${net_proceeds:,.0f}</h1>
-                        <p style="margin: 0; color: white; opacity: 0.9;">After all selling costs</p>
+                    <div class="card-proceeds">
+                        <h3>💰 Net Proceeds</h3>
+                        <h1>${net_proceeds:,.0f}</h1>
+                        <p>After all selling costs</p>
                     </div>
                     """, unsafe_allow_html=True)
                 
-                # Proceeds percentage
-                proceeds_percentage = (net_proceeds / final_sale_price) * 100
+                # Proceeds percentages - share one reciprocal of the sale price
+                pct_of_price = 100.0 / final_sale_price
                 total_deductions = total_costs + mortgage_payoff
+                proceeds_percentage = net_proceeds * pct_of_price
+                costs_percentage = total_costs * pct_of_price
+                mortgage_percentage = mortgage_payoff * pct_of_price
+                deductions_percentage = total_deductions * pct_of_price
                 st.markdown(f"""
-                <div style="background-color: #f8f9fa; padding: 1rem; border-radius: 0.5rem; margin: 1rem 0; text-align: center;">
+                <div class="card-tally">
                     <strong>You keep {proceeds_percentage:.1f}% of the sale price</strong><br>
-                    Selling costs: ${total_costs:,.0f} ({(total_costs/final_sale_price)*100:.1f}%) | 
-                    Mortgage payoff: ${mortgage_payoff:,.0f} ({(mortgage_payoff/final_sale_price)*100:.1f}%)<br>
-                    <strong>Total deductions: ${total_deductions:,.0f} ({(total_deductions/final_sale_price)*100:.1f}%)</strong>
+                    Selling costs: ${total_costs:,.0f} ({costs_percentage:.1f}%) | 
+                    Mortgage payoff: ${mortgage_payoff:,.0f} ({mortgage_percentage:.1f}%)<br>
+                    <strong>Total deductions: ${total_deductions:,.0f} ({deductions_percentage:.1f}%)</strong>
                 </div>
                 """, unsafe_allow_html=True)
             else:
@@ -3,12 +3,15 @@
 Test script to verify specific filtering is working correctly
 """
 
-from data_preprocessing import load_all_datasets
+import sys
 
-def test_filtering():
+import pytest
+
+def test_filtering(datasets):
     print("🧪 Testing Data Filtering...")
     
-    datasets = load_all_datasets()
+    # Every violation found, reported together once all datasets are checked
+    failures = []
     
     for name, data in datasets.items():
         if data is not None:
@@ -16,45 +19,65 @@ def test_filtering():
             print(f"\n📊 {name}:")
             print(f"   Total properties: {len(df_sold)}")
             
+            # Min and max of both range-checked columns in one aggregation
+            range_columns = [col for col in ['Finished Sqft', 'Year Built'] if col in df_sold.columns]
+            ranges = df_sold[range_columns].agg(['min', 'max']) if range_columns else None
+            
             # Test square footage range
             if 'Finished Sqft' in df_sold.columns:
-                min_sqft = df_sold['Finished Sqft'].min()
-                max_sqft = df_sold['Finished Sqft'].max()
+                min_sqft = ranges.loc['min', 'Finished Sqft']
+                max_sqft = ranges.loc['max', 'Finished Sqft']
                 print(f"   Square footage range: {min_sqft:.0f} - {max_sqft:.0f} sq ft")
                 
-                # Check for outliers
-                outliers = df_sold[(df_sold['Finished Sqft'] < 1100) | (df_sold['Finished Sqft'] > 1900)]
-                if len(outliers) > 0:
+                # Check for outliers - eval() builds the mask in one pass (numexpr when
+                # installed); the rows are only sliced out when there is something to report
+                outlier_mask = df_sold.eval('`Finished Sqft` < 1100 or `Finished Sqft` > 1900')
+                if outlier_mask.any():
+                    outliers = df_sold[outlier_mask]
                     print(f"   ❌ ERROR: {len(outliers)} properties outside 1100-1900 range found!")
-                    for idx, row in outliers.iterrows():
-                        print(f"      - {row.get('Full_Address', 'Unknown')}: {row['Finished Sqft']} sq ft")
+                    failures.append(f"{name}: {len(outliers)} properties outside 1100-1900 sq ft")
+                    addresses = outliers['Full_Address'].to_numpy() if 'Full_Address' in outliers.columns else ['Unknown'] * len(outliers)
+                    for address, sqft in zip(addresses, outliers['Finished Sqft'].to_numpy()):
+                        print(f"      - {address}: {sqft} sq ft")
                 else:
                     print(f"   ✅ All properties within 1100-1900 sq ft range")
             
-            # Test for 15807 131st specifically
+            # Test for 15807 131st specifically - by address text and by street
+            # fields, independently of the loader's normalized-address filter
             if 'Full_Address' in df_sold.columns:
-                problematic = df_sold[df_sold['Full_Address'].str.contains('15807 131st', case=False, na=False)]
-                if len(problematic) > 0:
+                problematic_mask = df_sold['Full_Address'].str.contains(r'15807\s+131st', case=False, na=False)
+                if 'Street Number' in df_sold.columns and 'Street Name' in df_sold.columns:
+                    problematic_mask |= ((df_sold['Street Number'] == 15807).fillna(False) &
+                                         df_sold['Street Name'].astype(str).str.contains('131st', case=False, na=False))
+                if problematic_mask.any():
+                    problematic = df_sold[problematic_mask]
                     print(f"   ❌ ERROR: 15807 131st still found in dataset!")
-                    for idx, row in problematic.iterrows():
-                        print(f"      - {row['Full_Address']}: {row.get('Finished Sqft', 'Unknown')} sq ft")
+                    failures.append(f"{name}: 15807 131st still present")
+                    sqfts = problematic['Finished Sqft'].to_numpy() if 'Finished Sqft' in problematic.columns else ['Unknown'] * len(problematic)
+                    for address, sqft in zip(problematic['Full_Address'].to_numpy(), sqfts):
+                        print(f"      - {address}: {sqft} sq ft")
                 else:
                     print(f"   ✅ 15807 131st successfully removed")
             
             # Test year built filter
             if 'Year Built' in df_sold.columns:
-                recent_homes = df_sold[df_sold['Year Built'] > 2020]
-                if len(recent_homes) > 0:
+                recent_mask = df_sold['Year Built'] > 2020
+                if recent_mask.any():
+                    recent_homes = df_sold[recent_mask]
                     print(f"   ❌ ERROR: {len(recent_homes)} properties built after 2020 found!")
-                    for idx, row in recent_homes.iterrows():
-                        print(f"      - {row.get('Full_Address', 'Unknown')}: Built {row['Year Built']}")
+                    failures.append(f"{name}: {len(recent_homes)} properties built after 2020")
+                    addresses = recent_homes['Full_Address'].to_numpy() if 'Full_Address' in recent_homes.columns else ['Unknown'] * len(recent_homes)
+                    for address, year_built in zip(addresses, recent_homes['Year Built'].to_numpy()):
+                        print(f"      - {address}: Built {year_built}")
                 else:
                     print(f"   ✅ No properties built after 2020")
                 
                 # Show year range
-                min_year = df_sold['Year Built'].min()
-                max_year = df_sold['Year Built'].max()
+                min_year = ranges.loc['min', 'Year Built']
+                max_year = ranges.loc['max', 'Year Built']
                 print(f"   Year built range: {min_year:.0f} - {max_year:.0f}")
+    
+    assert not failures, "Filtering violations: " + "; ".join(failures)
 
 if __name__ == "__main__":
-    test_filtering()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
\ No newline at end of file
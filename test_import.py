@@ -3,15 +3,17 @@
 Test script to verify all imports and data loading work correctly
 """
 
-try:
-    from data_preprocessing import load_all_datasets, get_recent_market_data, calculate_market_stats
+import sys
+
+def test_import(datasets):
+    from data_preprocessing import get_recent_market_data, calculate_market_stats
     print("✅ All imports successful")
     
     # Test data loading
-    datasets = load_all_datasets()
     print(f"✅ Data loading successful - {len(datasets)} datasets loaded")
     
     # Test each dataset
+    failed = []
     for name, data in datasets.items():
         if data is not None:
             print(f"✅ {name}: {data['sold_records']} sold properties")
@@ -26,10 +28,16 @@ try:
                 print(f"   - Median price: ${stats.get('median_price', 0):,.0f}")
         else:
             print(f"❌ {name}: Failed to load")
+            failed.append(name)
     
+    assert not failed, f"Datasets failed to load: {', '.join(failed)}"
     print("\n🎉 All tests passed! App should work correctly.")
-    
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-except Exception as e:
-    print(f"❌ Error: {e}")
\ No newline at end of file
+
+if __name__ == "__main__":
+    # Plain-script entry point for run_app.sh, so starting the app needs no pytest
+    from cached_loader import cached_load
+    try:
+        test_import(cached_load())
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
\ No newline at end of file
@@ -3,20 +3,19 @@
 Test the new streamlined premium home pricing analysis
 """
 
-from data_preprocessing import load_all_datasets
-from neighborhood_analysis_app import analyze_premium_home_pricing
+import sys
 
-def test_new_pricing():
+import pytest
+
+def test_new_pricing(datasets, pricing_1600):
     print("🏠 Testing New Streamlined Pricing Analysis...")
     
-    datasets = load_all_datasets()
-    
     sunrise_data = datasets.get('Sunrise Area', {}).get('sold', None)
     rebecca_data = datasets.get('Rebecca Ridge', {}).get('sold', None)
     
     if sunrise_data is not None and rebecca_data is not None:
         # Test new pricing analysis
-        pricing = analyze_premium_home_pricing(sunrise_data, rebecca_data, 1600)
+        pricing = pricing_1600
         
         if pricing:
             print(f"\n💰 New Pricing Analysis (1600 sq ft):")
@@ -36,14 +35,16 @@ def test_new_pricing():
             # Show sample comparables
             if len(pricing['sunrise_top']) > 0:
                 print(f"\nTop Sunrise Comparables:")
-                for idx, (_, row) in enumerate(pricing['sunrise_top'].iterrows()):
+                for idx, row in enumerate(pricing['sunrise_top']):
                     price = row['Selling Price']
                     sqft = row.get('Finished Sqft', 0)
                     print(f"   {idx+1}. ${price:,.0f} | {sqft:.0f} sq ft")
         else:
             print("❌ New pricing analysis failed")
+            pytest.fail("New pricing analysis failed")
     else:
         print("❌ Required data not available")
+        pytest.fail("Required data not available")
 
 if __name__ == "__main__":
-    test_new_pricing()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
\ No newline at end of file
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test the "last N months" market windows on unsorted frames and missing dates
+"""
+
+import sys
+
+import pandas as pd
+import pytest
+
+from data_preprocessing import get_recent_market_data, get_recent_market_windows
+
+def expected_recent(df_sold, months_back):
+    """Reference result: every row sold within N months of the latest sale"""
+    cutoff_date = df_sold['Selling Date'].max() - pd.DateOffset(months=months_back)
+    return df_sold[df_sold['Selling Date'] >= cutoff_date]
+
+def test_shuffled_frame(datasets):
+    print("🔀 Testing recent market windows on a shuffled frame...")
+    
+    for name, data in datasets.items():
+        if data is None:
+            continue
+        shuffled = data['sold'].sample(frac=1, random_state=0)
+        for months in (3, 12, 24):
+            recent = get_recent_market_data(shuffled, months)
+            expected = expected_recent(shuffled, months)
+            print(f"   {name}, {months} months: {len(recent)} sales")
+            assert recent.index.equals(expected.index), f"{name}: wrong {months} month window"
+
+def test_missing_dates():
+    print("📅 Testing recent market windows with missing Selling Dates...")
+    
+    df_sold = pd.DataFrame({
+        'Selling Date': pd.to_datetime(['2025-06-01', None, '2024-01-15', '2025-03-10', None, '2023-05-01']),
+        'Selling Price': [500000.0, 510000.0, 480000.0, 495000.0, 470000.0, 450000.0],
+    })
+    
+    windows = get_recent_market_windows(df_sold, (3, 12, 24))
+    assert windows[3].index.tolist() == [0, 3]
+    assert windows[12].index.tolist() == [0, 3]
+    assert windows[24].index.tolist() == [0, 2, 3]
+    
+    # No dates at all - nothing to cut against, so every row is kept
+    undated = df_sold.assign(**{'Selling Date': pd.NaT})
+    assert len(get_recent_market_data(undated, 12)) == len(undated)
+    print("   ✅ Missing dates are excluded from every window")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -3,20 +3,19 @@
 Test the unified app without toggles
 """
 
-from data_preprocessing import load_all_datasets
-from neighborhood_analysis_app import analyze_premium_home_pricing
+import sys
 
-def test_unified_app():
+import pytest
+
+def test_unified_app(datasets, dataset_summary, pricing_1600):
     print("🏠 Testing Unified App (No Toggles)...")
     
-    datasets = load_all_datasets()
-    
     print(f"\n📊 Available Datasets:")
-    for name, data in datasets.items():
-        if data:
-            print(f"   ✅ {name}: {data['sold_records']} sold properties")
+    for row in dataset_summary.itertuples(index=False):
+        if row.loaded:
+            print(f"   ✅ {row.name}: {row.sold_records} sold properties")
         else:
-            print(f"   ❌ {name}: Failed to load")
+            print(f"   ❌ {row.name}: Failed to load")
     
     # Test the unified pricing approach
     rebecca_data = datasets.get('Rebecca Ridge', {})
@@ -28,10 +27,7 @@ def test_unified_app():
         print(f"   Context: Rebecca Ridge ({rebecca_data['sold_records']} properties)")
         
         # Test pricing analysis
-        sunrise_sold = sunrise_data['sold']
-        rebecca_sold = rebecca_data['sold']
-        
-        pricing = analyze_premium_home_pricing(sunrise_sold, rebecca_sold, 1600)
+        pricing = pricing_1600
         
         if pricing:
             print(f"\n💰 Unified Pricing Result:")
@@ -47,8 +43,10 @@ def test_unified_app():
             print(f"📱 App will show single combined analysis with no confusing toggles")
         else:
             print("❌ Unified pricing analysis failed")
+            pytest.fail("Unified pricing analysis failed")
     else:
         print("❌ Both datasets required for unified analysis")
+        pytest.fail("Both datasets required for unified analysis")
 
 if __name__ == "__main__":
-    test_unified_app()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
\ No newline at end of file